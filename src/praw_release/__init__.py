@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import argparse
 import contextlib
+import os
 import sys
+import urllib.parse
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import TextIO
 
-from praw_release.changes_utils import extract_version_changes
+from praw_release.changes_utils import iter_sections
+from praw_release.github_utils import API_URL, publish_releases
 from praw_release.version_utils import (
     calculate_development_version,
     update_changes,
@@ -24,6 +27,42 @@ CHANGES_FILENAME = "CHANGES.rst"
 COMMIT_PREFIX = "Bump to v"
 
 
+def _api_url(value: str, /) -> str:
+    """Return ``value``, requiring that it be an HTTP or HTTPS URL with a host."""
+    try:
+        url = urllib.parse.urlsplit(value)
+        valid = url.scheme in {"http", "https"} and bool(url.hostname) and (url.port is None or url.port > 0)
+    except ValueError:
+        valid = False
+    if not valid:
+        message = f"invalid URL: {value!r}"
+        raise argparse.ArgumentTypeError(message)
+    return value
+
+
+def _github_token() -> str | None:
+    """Return the GitHub token from the environment if it is set and valid."""
+    if not (token := os.environ.get("GITHUB_TOKEN", "").strip()):
+        sys.stderr.write("GITHUB_TOKEN environment variable is not set\n")
+        return None
+    if any(character.isspace() for character in token):
+        sys.stderr.write("GITHUB_TOKEN environment variable contains whitespace\n")
+        return None
+    return token
+
+
+def _positive_int(value: str, /) -> int:
+    """Return ``value`` as an integer, requiring that it be positive."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        message = f"invalid positive integer: {value!r}"
+        raise argparse.ArgumentTypeError(message)
+    return number
+
+
 def command_bump(*, changes_file: TextIO, package_name: str, version: str, version_file: TextIO) -> bool:
     """Validate version string and update the code and CHANGELOG using the desired version."""
     unreleased = False
@@ -52,7 +91,9 @@ def command_bump(*, changes_file: TextIO, package_name: str, version: str, versi
 
 def command_changes(changes_file: TextIO, version: str) -> bool:
     """Output the changes entry for the provided version."""
-    changes = extract_version_changes(source=changes_file.read(), version=version)
+    changes = next(
+        (body for section_version, _, body in iter_sections(changes_file) if section_version == version), None
+    )
     if changes is None:
         sys.stderr.write(f"No {changes_file.name} entry for {version}\n")
         return False
@@ -70,6 +111,40 @@ def command_extract_version() -> bool:
     return True
 
 
+def command_publish(
+    *, api_url: str, changes_file: TextIO, concurrency: int, repository: str, versions: list[str]
+) -> bool:
+    """Create or update the GitHub release for each version using its changes entry."""
+    if (token := _github_token()) is None:
+        return False
+    for version in versions:
+        if (parsed_version := valid_version(version)) is None:
+            return False
+        if str(parsed_version) != version:  # changelog entries and tags use the normalized version
+            sys.stderr.write(f"Version {version} is not normalized; use {parsed_version}\n")
+            return False
+
+    notes = dict.fromkeys(versions, "")
+    remaining = set(versions)
+    for version, _, body in iter_sections(changes_file):
+        if version in remaining:
+            notes[version] = body
+            remaining.remove(version)
+            if not remaining:
+                break
+    if remaining:
+        sys.stderr.writelines(
+            f"No {changes_file.name} entry for {version}\n" for version in versions if version in remaining
+        )
+        return False
+
+    urls = publish_releases(api_url=api_url, concurrency=concurrency, notes=notes, repository=repository, token=token)
+    if urls is None:
+        return False
+    sys.stdout.writelines(f"{url}\n" for url in urls)
+    return True
+
+
 def main() -> int:
     """Provide the entrypoint into the CLI."""
     parser = argparse.ArgumentParser(prog="praw-release")
@@ -90,6 +165,14 @@ def main() -> int:
     extract_parser = subparsers.add_parser("extract-version")
     extract_parser.set_defaults(command=command_extract_version, file_modes={})
 
+    publish_parser = subparsers.add_parser("publish")
+    publish_parser.add_argument("--api-url", default=API_URL, type=_api_url)
+    publish_parser.add_argument("--changes_file", default=CHANGES_FILENAME)
+    publish_parser.add_argument("--concurrency", default=4, type=_positive_int)
+    publish_parser.add_argument("repository")
+    publish_parser.add_argument("versions", nargs="+")
+    publish_parser.set_defaults(command=command_publish, file_modes={"changes_file": "r"})
+
     command_arguments = vars(parser.parse_args())
     command = command_arguments.pop("command")
     file_modes = command_arguments.pop("file_modes")
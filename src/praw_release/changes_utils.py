@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import re
+import string
+from typing import TYPE_CHECKING
+
 import docutils.nodes
 from docutils.frontend import get_default_settings
 from docutils.parsers.rst import Parser
 from docutils.utils import new_document
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+DATE_RE = re.compile(r"\((\d{4}/\d{2}/\d{2})\)")
+MIN_SHORT_ADORNMENT = 4
+
+
+def _build_section(*, lines: list[str], title: str) -> tuple[str, str | None, str]:
+    """Return the ``(version, date, body)`` tuple for a section."""
+    version, *remainder = title.split(None, 1)
+    date = match.group(1) if (match := DATE_RE.search("".join(remainder))) else None
+    body = "".join(lines).strip("\n")
+    return version, date, f"{body}\n" if body else ""
+
 
 def _get_entry_slice(*, document: docutils.nodes.document, version: str) -> slice | None:
     """Return the line numbers that encompass the version's changelog entry."""
@@ -37,6 +56,37 @@ def _get_entry_slice(*, document: docutils.nodes.document, version: str) -> slic
     return slice(start_line, end_line)
 
 
+def _is_adornment(text: str, /) -> bool:
+    """Return whether ``text`` is a section title overline or underline."""
+    return bool(text) and text[0] in string.punctuation and text == text[0] * len(text)
+
+
+def _match_heading(*, line: str, lines: list[str]) -> tuple[tuple[str, bool], str] | None:
+    """Return the style and title of the heading completed by underline ``line``.
+
+    ``lines`` are the lines read since the previous heading. The style is the
+    adornment character paired with whether the title has an overline.
+    """
+    adornment = line.rstrip()
+    if not lines or not _is_adornment(adornment):
+        return None
+    title = lines[-1].strip()
+    if not title or _is_adornment(title):
+        return None
+    if len(adornment) < min(len(title), MIN_SHORT_ADORNMENT):  # docutils only warns for longer short adornments
+        return None
+
+    overlined = len(lines) > 1 and lines[-2].rstrip() == adornment
+    if not overlined and lines[-1][0].isspace():
+        return None
+    preceding_index = -3 if overlined else -2
+    if len(lines) >= -preceding_index:
+        preceding = lines[preceding_index].rstrip()
+        if preceding and not _is_adornment(preceding):
+            return None
+    return (adornment[0], overlined), title
+
+
 def _parse_rst(text: str, /) -> docutils.nodes.document:
     """Parse ``text`` as reStructuredText."""
     parser = Parser()
@@ -57,3 +107,37 @@ def extract_version_changes(*, source: str, version: str) -> str | None:
         return None
     changes = "".join(source.splitlines(keepends=True)[entry_slice]).strip("\n")
     return f"{changes}\n" if changes else ""
+
+
+def iter_sections(changes_file: TextIO, /) -> Iterator[tuple[str, str | None, str]]:
+    """Yield ``(version, date, body)`` for each changelog entry in ``changes_file``.
+
+    The file is read lazily, so no more of it is read than is needed to produce
+    the sections consumed by the caller. ``date`` is ``None`` when the section
+    title does not contain a ``(YYYY/MM/DD)`` date. As with
+    :func:`extract_version_changes`, the section heading is excluded from ``body``.
+    """
+    styles: list[tuple[str, bool]] = []
+    lines: list[str] = []
+    title = None
+    for line in changes_file:
+        if (heading := _match_heading(line=line, lines=lines)) is None:
+            lines.append(line)
+            continue
+        style, heading_title = heading
+        if new_style := style not in styles:
+            styles.append(style)
+        level = styles.index(style)
+        if level > 1:  # subsections are part of the entry's body
+            lines.append(line)
+            continue
+
+        if title is not None:
+            yield _build_section(lines=lines[: -2 if style[1] else -1], title=title)
+        if level == 0 and not new_style:  # entries end with the document title's section
+            return
+        lines = []
+        title = heading_title if level == 1 else None
+
+    if title is not None:
+        yield _build_section(lines=lines, title=title)
@@ -0,0 +1,218 @@
+"""Functions pertaining to the GitHub Releases API."""
+
+from __future__ import annotations
+
+import email.utils
+import http.client
+import json
+import queue
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+import packaging.version
+
+API_URL = "https://api.github.com"
+BACKOFF_SECONDS = 1.0
+IDEMPOTENT_METHODS = frozenset({"GET", "PATCH"})
+MAX_ATTEMPTS = 5
+MAX_RATE_LIMIT_DELAY_SECONDS = 300
+RATE_LIMIT_STATUSES = frozenset({403, 429})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+TAG_PREFIX = "v"
+TIMEOUT_SECONDS = 30
+
+
+def _decode_response(*, data: bytes, method: str, path: str, status: int) -> tuple[int, dict[str, object]] | None:
+    """Return the status and JSON object body of a response."""
+    try:
+        decoded = json.loads(data) if data else {}
+    except ValueError:
+        decoded = None
+    if not isinstance(decoded, dict):
+        sys.stderr.write(f"{method} {path} returned a non-JSON object response with status {status}\n")
+        return None
+    return status, decoded
+
+
+def _rate_limit_delay(response: http.client.HTTPResponse, /) -> float | None:
+    """Return the seconds to wait before retrying a rate limited request, if it was."""
+    if (retry_after := response.getheader("Retry-After")) is not None:
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except ValueError:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        return max((retry_at - datetime.now(tz=UTC)).total_seconds(), 0)
+    if response.getheader("X-RateLimit-Remaining") == "0" and (reset := response.getheader("X-RateLimit-Reset")):
+        try:
+            return max(float(reset) - time.time(), 0)
+        except ValueError:
+            return None
+    return None
+
+
+def _request(
+    *,
+    body: dict[str, object] | None = None,
+    connections: queue.SimpleQueue[http.client.HTTPConnection],
+    headers: dict[str, str],
+    method: str,
+    path: str,
+) -> tuple[int, dict[str, object]] | None:
+    """Send a request over a pooled connection, retrying transient failures.
+
+    Rate limited requests are retried once the rate limit resets unless that is
+    more than ``MAX_RATE_LIMIT_DELAY_SECONDS`` away. Connection errors and server
+    errors are retried with exponential backoff only for idempotent methods;
+    otherwise ``None`` is returned without writing an error, as the request may
+    have taken effect.
+    """
+    payload = None if body is None else json.dumps(body)
+    for attempt in range(MAX_ATTEMPTS):
+        connection = connections.get()
+        try:
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except OSError, http.client.HTTPException:
+            connection.close()  # the next request on this connection reconnects
+            delay = None
+        else:
+            if response.status in RATE_LIMIT_STATUSES and (rate_limit_delay := _rate_limit_delay(response)) is not None:
+                if rate_limit_delay > MAX_RATE_LIMIT_DELAY_SECONDS:
+                    sys.stderr.write(f"{method} {path} is rate limited for {rate_limit_delay:.0f} seconds\n")
+                    return None
+                delay = rate_limit_delay
+            elif response.status in RETRY_STATUSES:
+                delay = None
+            else:
+                return _decode_response(data=data, method=method, path=path, status=response.status)
+        finally:
+            connections.put(connection)
+        if delay is None:
+            if method not in IDEMPOTENT_METHODS:
+                return None
+            delay = BACKOFF_SECONDS * 2**attempt
+        if attempt + 1 < MAX_ATTEMPTS:
+            time.sleep(delay)
+    sys.stderr.write(f"{method} {path} failed after {MAX_ATTEMPTS} attempts\n")
+    return None
+
+
+def _upsert_release(
+    *,
+    connections: queue.SimpleQueue[http.client.HTTPConnection],
+    headers: dict[str, str],
+    notes: str,
+    releases_path: str,
+    version: str,
+) -> str | None:
+    """Create or update the release for ``version`` and return its URL."""
+    tag_name = f"{TAG_PREFIX}{version}"
+    body: dict[str, object] = {
+        "body": notes,
+        "name": tag_name,
+        "prerelease": packaging.version.parse(version).is_prerelease,
+    }
+
+    # A failed POST may have created the release, so look it up again before resending.
+    for attempt in range(MAX_ATTEMPTS):
+        result = _request(
+            connections=connections,
+            headers=headers,
+            method="GET",
+            path=f"{releases_path}/tags/{urllib.parse.quote(tag_name)}",
+        )
+        if result is None:
+            return None
+        status, release = result
+        if status == http.HTTPStatus.OK and (release_id := release.get("id")) is not None:
+            expected_status = http.HTTPStatus.OK
+            result = _request(
+                body=body,
+                connections=connections,
+                headers=headers,
+                method="PATCH",
+                path=f"{releases_path}/{release_id}",
+            )
+            break
+        if status != http.HTTPStatus.NOT_FOUND:
+            sys.stderr.write(f"Unexpected response {status} looking up release {tag_name}\n")
+            return None
+        expected_status = http.HTTPStatus.CREATED
+        result = _request(
+            body={**body, "tag_name": tag_name},
+            connections=connections,
+            headers=headers,
+            method="POST",
+            path=releases_path,
+        )
+        if result is not None:
+            break
+        if attempt + 1 < MAX_ATTEMPTS:
+            time.sleep(BACKOFF_SECONDS * 2**attempt)
+    else:
+        sys.stderr.write(f"Failed to create release {tag_name} after {MAX_ATTEMPTS} attempts\n")
+        return None
+
+    if result is None:
+        return None
+    status, release = result
+    if status != expected_status or (html_url := release.get("html_url")) is None:
+        sys.stderr.write(f"Unexpected response {status} publishing release {tag_name}: {release.get('message')}\n")
+        return None
+    return str(html_url)
+
+
+def publish_releases(
+    *, api_url: str, concurrency: int, notes: dict[str, str], repository: str, token: str
+) -> list[str] | None:
+    """Create or update a GitHub release for each version in ``notes``.
+
+    Releases are published by at most ``concurrency`` threads sharing a pool of
+    keep-alive connections. Return the URLs of the releases in the order of
+    ``notes``, or ``None`` if any release failed to publish.
+    """
+    url = urllib.parse.urlsplit(api_url)
+    connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+    connections: queue.SimpleQueue[http.client.HTTPConnection] = queue.SimpleQueue()
+    for _ in range(concurrency):
+        connections.put(connection_class(url.netloc, timeout=TIMEOUT_SECONDS))
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "User-Agent": "praw-release",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    releases_path = f"{url.path.rstrip('/')}/repos/{repository}/releases"
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    _upsert_release,
+                    connections=connections,
+                    headers=headers,
+                    notes=release_notes,
+                    releases_path=releases_path,
+                    version=version,
+                )
+                for version, release_notes in notes.items()
+            ]
+            release_urls = [future.result() for future in futures]
+    finally:
+        while not connections.empty():
+            connections.get().close()
+
+    if None in release_urls:
+        return None
+    return [release_url for release_url in release_urls if release_url is not None]
@@ -1,4 +1,6 @@
-from praw_release.changes_utils import extract_version_changes
+from io import StringIO
+
+from praw_release.changes_utils import extract_version_changes, iter_sections
 
 EXAMPLE_DOCUMENT = """Title
 =====
@@ -84,3 +86,78 @@ def test_extract_version_changes__version_with_earlier_prefix_match() -> None:
 def test_extract_version_changes__version_not_found() -> None:
     for invalid_version in ("1.0", "unreleased", "5.0 (other info)"):
         assert extract_version_changes(source=EXAMPLE_DOCUMENT, version=invalid_version) is None
+
+
+def test_iter_sections() -> None:
+    assert list(iter_sections(StringIO(EXAMPLE_DOCUMENT))) == [
+        ("Unreleased", None, ""),
+        ("5.0.1", None, "latest release\n"),
+        ("5.0", None, "a\nb\nc\n"),
+        ("last", None, ""),
+    ]
+
+
+def test_iter_sections__empty_file() -> None:
+    assert not list(iter_sections(StringIO()))
+
+
+def test_iter_sections__matches_extract_version_changes() -> None:
+    for source in (EXAMPLE_DOCUMENT, OVERLINED_DOCUMENT, "T\n=\n\n2.0\t(2020/01/01)\n-----------------\n\nbody\n"):
+        sections = list(iter_sections(StringIO(source)))
+        assert sections
+        for version, _, body in sections:
+            assert extract_version_changes(source=source, version=version) == body
+
+
+def test_iter_sections__tab_separated_date() -> None:
+    source = "T\n=\n\n2.0\t(2020/01/01)\n-----------------\n\nbody\n"
+    assert list(iter_sections(StringIO(source))) == [("2.0", "2020/01/01", "body\n")]
+
+
+def test_iter_sections__matches_extract_version_changes__short_adornments() -> None:
+    for source in (
+        "T\n=\n\n7.7.1 (2023/07/11)\n------\n\nbody\n\n7.7.0\n-----\n\nold\n",
+        "T\n=\n\n7.7.1 (2023/07/11)\n---\n\nbody\n\n7.7.0\n-----\n\nold\n",
+        "T\n=\n\n*******\n 7.7.1 (2023/07/11)\n*******\n\nbody\n\n*****\n 7.7.0 (2023/07/01)\n*****\n\nold\n",
+        "T\n=\n\n******\n 7.7.1\n******\n\nbody\n\n***\n 7.7.0 (2023/07/01)\n***\n\nold\n",
+        "T\n=\n\n******\n 7.7.1\n******\n\nbody\n\n*****\n 7.7.0 (2023/07/01)\n*******************\n\nold\n",
+    ):
+        sections = {version: body for version, _, body in iter_sections(StringIO(source))}
+        for version in ("7.7.1", "7.7.0"):
+            assert sections.get(version) == extract_version_changes(source=source, version=version)
+
+
+def test_iter_sections__no_title() -> None:
+    assert not list(iter_sections(StringIO("1.0\n---")))
+    assert not list(iter_sections(StringIO("\n1.0\n---")))
+
+
+def test_iter_sections__non_headings() -> None:
+    source = "Title\n=====\n\n1.0\n---\n- a\n-\n\n----\n\n  indented\n----------\ntext\nab\n---\nlonger title\n---\n"
+    assert list(iter_sections(StringIO(source))) == [
+        ("1.0", None, "- a\n-\n\n----\n\n  indented\n----------\ntext\nab\n---\nlonger title\n---\n")
+    ]
+
+
+def test_iter_sections__overlined_sections() -> None:
+    assert list(iter_sections(StringIO(OVERLINED_DOCUMENT))) == [
+        ("1.1.0", "2026/06/07", "**Added**\n\n- New feature.\n"),
+        ("1.0.0", "2025/01/01", "**Fixed**\n\n- A fix.\n"),
+    ]
+
+
+def test_iter_sections__reads_lazily() -> None:
+    source = "A\n=\n\n" + "".join(f"1.{minor}\n-----\nx\n\n" for minor in range(100, 0, -1))
+    changes_file = StringIO(source)
+    assert next(iter_sections(changes_file)) == ("1.100", None, "x\n")
+    assert changes_file.tell() < len(source) / 10
+
+
+def test_iter_sections__stops_at_next_document_section() -> None:
+    source = "A\n=\n\n1.0\n---\nx\n\nB\n=\n\n0.9\n---\n"
+    assert list(iter_sections(StringIO(source))) == [("1.0", None, "x\n")]
+
+
+def test_iter_sections__subsections() -> None:
+    source = "A\n=\n\n1.0\n---\n\nSub\n~~~\nx\n\n0.9\n---\n"
+    assert list(iter_sections(StringIO(source))) == [("1.0", None, "Sub\n~~~\nx\n"), ("0.9", None, "")]
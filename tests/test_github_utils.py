@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from praw_release import github_utils
+from praw_release.github_utils import publish_releases
+from tests.utils import StubGitHubServer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def server() -> Iterator[StubGitHubServer]:
+    with StubGitHubServer() as server, patch.object(github_utils, "BACKOFF_SECONDS", 0):
+        yield server
+
+
+def publish(server: StubGitHubServer, notes: dict[str, str], concurrency: int = 2) -> list[str] | None:
+    return publish_releases(
+        api_url=server.url, concurrency=concurrency, notes=notes, repository="owner/repo", token=server.token
+    )
+
+
+def test_publish_releases(server: StubGitHubServer) -> None:
+    server.releases["v1.0"] = {"body": "old\n", "html_url": "https://github.com/releases/v1.0", "id": 1}
+    assert publish(server, {"1.0": "a\n", "1.1rc1": "b\n"}) == [
+        "https://github.com/releases/v1.0",
+        "https://github.com/releases/v1.1rc1",
+    ]
+    assert server.releases["v1.0"]["body"] == "a\n"
+    assert server.releases["v1.1rc1"] == {
+        "body": "b\n",
+        "html_url": "https://github.com/releases/v1.1rc1",
+        "id": 2,
+        "name": "v1.1rc1",
+        "prerelease": True,
+        "tag_name": "v1.1rc1",
+    }
+    assert {(method, path) for method, path, _ in server.requests} == {
+        ("GET", "/api/v3/repos/owner/repo/releases/tags/v1.0"),
+        ("GET", "/api/v3/repos/owner/repo/releases/tags/v1.1rc1"),
+        ("PATCH", "/api/v3/repos/owner/repo/releases/1"),
+        ("POST", "/api/v3/repos/owner/repo/releases"),
+    }
+
+
+def test_publish_releases__exhausted_retries(capsys: pytest.CaptureFixture, server: StubGitHubServer) -> None:
+    server.failures["GET"] = [(503, {})] * github_utils.MAX_ATTEMPTS
+    assert publish(server, {"1.0": "a\n"}) is None
+    assert capsys.readouterr().err == "GET /api/v3/repos/owner/repo/releases/tags/v1.0 failed after 5 attempts\n"
+    assert not server.releases
+
+
+def test_publish_releases__exhausted_retries_publishing(
+    capsys: pytest.CaptureFixture, server: StubGitHubServer
+) -> None:
+    server.failures["POST"] = [(503, {})] * github_utils.MAX_ATTEMPTS
+    assert publish(server, {"1.0": "a\n"}) is None
+    assert capsys.readouterr().err == "Failed to create release v1.0 after 5 attempts\n"
+    assert [method for method, *_ in server.requests] == ["GET", "POST"] * github_utils.MAX_ATTEMPTS
+
+
+def test_publish_releases__exhausted_retries_updating(capsys: pytest.CaptureFixture, server: StubGitHubServer) -> None:
+    server.releases["v1.0"] = {"body": "old\n", "html_url": "https://github.com/releases/v1.0", "id": 1}
+    server.failures["PATCH"] = [(503, {})] * github_utils.MAX_ATTEMPTS
+    assert publish(server, {"1.0": "a\n"}) is None
+    assert capsys.readouterr().err == "PATCH /api/v3/repos/owner/repo/releases/1 failed after 5 attempts\n"
+
+
+def test_publish_releases__lost_create_response(server: StubGitHubServer) -> None:
+    server.disconnects["POST"] = 1
+    assert publish(server, {"1.0": "a\n"}) == ["https://github.com/releases/v1.0"]
+    assert [method for method, *_ in server.requests] == ["GET", "POST", "GET", "PATCH"]
+    assert list(server.releases) == ["v1.0"]
+
+
+def test_publish_releases__lost_update_response(server: StubGitHubServer) -> None:
+    server.releases["v1.0"] = {"body": "old\n", "html_url": "https://github.com/releases/v1.0", "id": 1}
+    server.disconnects["PATCH"] = 1
+    assert publish(server, {"1.0": "a\n"}) == ["https://github.com/releases/v1.0"]
+    assert [method for method, *_ in server.requests] == ["GET", "PATCH", "PATCH"]
+
+
+def test_publish_releases__pools_connections(server: StubGitHubServer) -> None:
+    notes = {f"1.{minor}": f"{minor}\n" for minor in range(50)}
+    concurrency = 3
+    urls = publish(server, notes, concurrency=concurrency)
+    assert urls == [f"https://github.com/releases/v{version}" for version in notes]
+    assert len(server.requests) == 2 * len(notes)
+    assert len(server.clients) <= concurrency
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        (None, {}),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}),
+        (429, {"Retry-After": "0"}),
+        (429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+        (429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 -0000"}),
+        (502, {}),
+    ],
+)
+def test_publish_releases__retries(failure: tuple[int | None, dict[str, str]], server: StubGitHubServer) -> None:
+    server.failures["GET"] = [failure]
+    assert publish(server, {"1.0": "a\n"}) == ["https://github.com/releases/v1.0"]
+    assert [method for method, *_ in server.requests] == ["GET", "GET", "POST"]
+
+
+def test_publish_releases__unexpected_lookup_response(capsys: pytest.CaptureFixture, server: StubGitHubServer) -> None:
+    server.failures["GET"] = [(403, {})]
+    assert publish(server, {"1.0": "a\n", "1.1": "b\n"}) is None
+    assert capsys.readouterr().err == "Unexpected response 403 looking up release v1.0\n"
+    assert list(server.releases) == ["v1.1"]
+
+
+def test_publish_releases__server_error_creating(server: StubGitHubServer) -> None:
+    server.failures["POST"] = [(502, {})]
+    assert publish(server, {"1.0": "a\n"}) == ["https://github.com/releases/v1.0"]
+    assert [method for method, *_ in server.requests] == ["GET", "POST", "GET", "POST"]
+
+
+def test_publish_releases__unexpected_publish_response(capsys: pytest.CaptureFixture, server: StubGitHubServer) -> None:
+    server.failures["POST"] = [(422, {})]
+    assert publish(server, {"1.0": "a\n"}) is None
+    assert capsys.readouterr().err == "Unexpected response 422 publishing release v1.0: stub failure\n"
+
+
+def test_publish_releases__unauthorized(capsys: pytest.CaptureFixture, server: StubGitHubServer) -> None:
+    notes = {"1.0": "a\n"}
+    assert publish_releases(api_url=server.url, concurrency=1, notes=notes, repository="owner/repo", token="") is None
+    assert capsys.readouterr().err == "Unexpected response 401 looking up release v1.0\n"
+
+
+def test_publish_releases__invalid_json(capsys: pytest.CaptureFixture, server: StubGitHubServer) -> None:
+    url = server.url.removesuffix("/api/v3")
+    assert publish_releases(api_url=url, concurrency=1, notes={"1.0": ""}, repository="o/r", token=server.token) is None
+    assert capsys.readouterr().err == (
+        "GET /repos/o/r/releases/tags/v1.0 returned a non-JSON object response with status 404\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Retry-After": "3600"},
+        {"Retry-After": format_datetime(datetime.now(tz=UTC) + timedelta(hours=1))},
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(datetime.now(tz=UTC).timestamp()) + 3600)},
+    ],
+)
+def test_publish_releases__rate_limit_too_long(
+    capsys: pytest.CaptureFixture, headers: dict[str, str], server: StubGitHubServer
+) -> None:
+    server.failures["GET"] = [(429, headers)]
+    assert publish(server, {"1.0": "a\n"}) is None
+    assert capsys.readouterr().err.startswith("GET /api/v3/repos/owner/repo/releases/tags/v1.0 is rate limited for ")
+
+
+@pytest.mark.parametrize(
+    "headers", [{"Retry-After": "soon"}, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "soon"}]
+)
+def test_publish_releases__rate_limit_unparsable(
+    capsys: pytest.CaptureFixture, headers: dict[str, str], server: StubGitHubServer
+) -> None:
+    server.failures["GET"] = [(429, headers)]
+    assert publish(server, {"1.0": "a\n"}) is None
+    assert capsys.readouterr().err == "Unexpected response 429 looking up release v1.0\n"
+
+
+def test_publish_releases__lookup_missing_id(capsys: pytest.CaptureFixture, server: StubGitHubServer) -> None:
+    server.failures["GET"] = [(200, {})]
+    assert publish(server, {"1.0": "a\n"}) is None
+    assert capsys.readouterr().err == "Unexpected response 200 looking up release v1.0\n"
+
+
+@pytest.mark.parametrize(("method", "status", "tag_name"), [("PATCH", 200, "v1.0"), ("POST", 201, "v2.0")])
+def test_publish_releases__publish_missing_html_url(
+    capsys: pytest.CaptureFixture, method: str, server: StubGitHubServer, status: int, tag_name: str
+) -> None:
+    server.releases["v1.0"] = {"body": "old\n", "html_url": "https://github.com/releases/v1.0", "id": 1}
+    server.failures[method] = [(status, {})]
+    assert publish(server, {"1.0": "a\n", "2.0": "b\n"}) is None
+    assert capsys.readouterr().err == f"Unexpected response {status} publishing release {tag_name}: stub failure\n"
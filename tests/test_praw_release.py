@@ -1,3 +1,4 @@
+import os
 import sys
 from io import StringIO
 from tempfile import NamedTemporaryFile
@@ -5,9 +6,9 @@ from unittest.mock import patch
 
 import pytest
 
-from praw_release import command_bump, command_changes, main
+from praw_release import command_bump, command_changes, command_publish, main
 from tests.test_version_utils import UNRELEASED_CHANGES
-from tests.utils import NamedStringIO
+from tests.utils import NamedStringIO, StubGitHubServer
 
 
 def test_command_bump(capsys: pytest.CaptureFixture) -> None:
@@ -70,6 +71,77 @@ def test_command_changes__version_not_found(capsys: pytest.CaptureFixture) -> No
     assert capsys.readouterr().err == "No CHANGES.rst entry for notfound\n"
 
 
+def test_command_publish(capsys: pytest.CaptureFixture) -> None:
+    changes_file = NamedStringIO("A\n=\n2.0\n---\ny\n\n1.0\n---\nx\n\n0.1\n---\n", name="CHANGES.rst")
+    with StubGitHubServer() as server, patch.dict(os.environ, {"GITHUB_TOKEN": f" {server.token}\n"}):
+        assert command_publish(
+            api_url=server.url, changes_file=changes_file, concurrency=2, repository="o/r", versions=["1.0", "2.0"]
+        )
+    assert capsys.readouterr().out == "https://github.com/releases/v1.0\nhttps://github.com/releases/v2.0\n"
+    assert {tag_name: release["body"] for tag_name, release in server.releases.items()} == {
+        "v1.0": "x\n",
+        "v2.0": "y\n",
+    }
+
+
+def test_command_publish__failure() -> None:
+    with StubGitHubServer() as server, patch.dict(os.environ, {"GITHUB_TOKEN": server.token}):
+        server.failures["POST"] = [(422, {})]
+        assert not command_publish(
+            api_url=server.url,
+            changes_file=NamedStringIO("A\n=\n1.0\n---\n"),
+            concurrency=1,
+            repository="o/r",
+            versions=["1.0"],
+        )
+
+
+def test_command_publish__invalid_version(capsys: pytest.CaptureFixture) -> None:
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "x"}):
+        assert not command_publish(
+            api_url="", changes_file=NamedStringIO(), concurrency=1, repository="o/r", versions=["Unreleased"]
+        )
+    assert capsys.readouterr().err == "invalid version Unreleased\n"
+
+
+def test_command_publish__non_normalized_version(capsys: pytest.CaptureFixture) -> None:
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "x"}):
+        for version, normalized in (("v1.0", "1.0"), ("1.0-rc1", "1.0rc1")):
+            assert not command_publish(
+                api_url="", changes_file=NamedStringIO(), concurrency=1, repository="o/r", versions=[version]
+            )
+            assert capsys.readouterr().err == f"Version {version} is not normalized; use {normalized}\n"
+
+
+def test_command_publish__missing_token(capsys: pytest.CaptureFixture) -> None:
+    for environ in ({"GITHUB_TOKEN": " \n"}, {}):
+        with patch.dict(os.environ, environ, clear=True):
+            assert not command_publish(
+                api_url="", changes_file=NamedStringIO(), concurrency=1, repository="o/r", versions=["1.0"]
+            )
+        assert capsys.readouterr().err == "GITHUB_TOKEN environment variable is not set\n"
+
+
+def test_command_publish__token_with_whitespace(capsys: pytest.CaptureFixture) -> None:
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "abc\ndef"}):
+        assert not command_publish(
+            api_url="", changes_file=NamedStringIO(), concurrency=1, repository="o/r", versions=["1.0"]
+        )
+    assert capsys.readouterr().err == "GITHUB_TOKEN environment variable contains whitespace\n"
+
+
+def test_command_publish__version_not_found(capsys: pytest.CaptureFixture) -> None:
+    with patch.dict(os.environ, {"GITHUB_TOKEN": "x"}):
+        assert not command_publish(
+            api_url="",
+            changes_file=NamedStringIO("A\n=\n1.0\n---\n", name="CHANGES.rst"),
+            concurrency=1,
+            repository="o/r",
+            versions=["2.0", "1.0", "0.1"],
+        )
+    assert capsys.readouterr().err == "No CHANGES.rst entry for 2.0\nNo CHANGES.rst entry for 0.1\n"
+
+
 def test_main__changes__fails(capsys: pytest.CaptureFixture) -> None:
     with (
         NamedTemporaryFile() as changes_file,
@@ -103,10 +175,56 @@ def test_main__extract_version__not_found(capsys: pytest.CaptureFixture) -> None
     assert capsys.readouterr().err == "Commit message does not begin with `Bump to v`.\nMessage:\n\nOne line"
 
 
+def test_main__publish(capsys: pytest.CaptureFixture) -> None:
+    with NamedTemporaryFile("w", encoding="utf-8", suffix=".rst") as changes_file, StubGitHubServer() as server:
+        changes_file.write("A\n=\n1.0\n---\nx\n")
+        changes_file.flush()
+        argv = [
+            "progname",
+            "publish",
+            "--api-url",
+            server.url,
+            "--concurrency",
+            "2",
+            "--changes_file",
+            changes_file.name,
+            "o/r",
+            "1.0",
+        ]
+        with patch.object(sys, "argv", argv), patch.dict(os.environ, {"GITHUB_TOKEN": server.token}):
+            assert main() == 0
+    assert capsys.readouterr().out == "https://github.com/releases/v1.0\n"
+    assert server.requests[-1] == (
+        "POST",
+        "/api/v3/repos/o/r/releases",
+        {"body": "x\n", "name": "v1.0", "prerelease": False, "tag_name": "v1.0"},
+    )
+
+
+def test_main__publish__invalid_api_url(capsys: pytest.CaptureFixture) -> None:
+    for api_url in ("htps://api.github.com", "ftp://api.github.com", "api.github.com", "https://", "http://host:x"):
+        with (
+            patch.object(sys, "argv", ["progname", "publish", "--api-url", api_url, "o/r", "1.0"]),
+            pytest.raises(SystemExit),
+        ):
+            main()
+        assert f"argument --api-url: invalid URL: '{api_url}'" in capsys.readouterr().err
+
+
+def test_main__publish__invalid_concurrency(capsys: pytest.CaptureFixture) -> None:
+    for concurrency in ("0", "-1", "many"):
+        with (
+            patch.object(sys, "argv", ["progname", "publish", "--concurrency", concurrency, "o/r", "1.0"]),
+            pytest.raises(SystemExit),
+        ):
+            main()
+        assert f"argument --concurrency: invalid positive integer: '{concurrency}'" in capsys.readouterr().err
+
+
 def test_main__no_command(capsys: pytest.CaptureFixture) -> None:
     with patch.object(sys, "argv", ["progname"]), pytest.raises(SystemExit):
         main()
     assert (
         capsys.readouterr().err
-        == "usage: praw-release [-h] {bump,changes,extract-version} ...\npraw-release: error: the following arguments are required: {bump,changes,extract-version}\n"
+        == "usage: praw-release [-h] {bump,changes,extract-version,publish} ...\npraw-release: error: the following arguments are required: {bump,changes,extract-version,publish}\n"
     )
@@ -1,7 +1,111 @@
+from __future__ import annotations
+
+import json
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import StringIO
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 class NamedStringIO(StringIO):
     def __init__(self, *args: str, name: str = "__init__.py") -> None:
         super().__init__(*args)
         self.name = name
+
+
+class StubGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1  # send each response in one write to avoid delayed ACK stalls on keep-alive connections
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_PATCH(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        self._handle()
+
+    def _handle(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or "null")
+        server = self.server
+        assert isinstance(server, StubGitHubServer)
+        with server.lock:
+            server.clients.add(self.client_address)
+            server.requests.append((self.command, self.path, payload))
+            if self.headers["Authorization"] != f"Bearer {server.token}":
+                self._respond(401, {"message": "Bad credentials"})
+                return
+            if not self.path.startswith("/api/v3/"):
+                self._respond(404, "<html>Not Found</html>")
+                return
+            if failures := server.failures.get(self.command):
+                status, headers = failures.pop(0)
+                if status is None:
+                    self.close_connection = True
+                    return
+                self._respond(status, {"message": "stub failure"}, headers)
+                return
+            if self.command == "GET":
+                release = server.releases.get(self.path.rsplit("/", 1)[1])
+                status, body = (200, release) if release else (404, {"message": "Not Found"})
+            elif self.command == "PATCH":
+                release_id = int(self.path.rsplit("/", 1)[1])
+                release = next(release for release in server.releases.values() if release["id"] == release_id)
+                release.update(payload)
+                status, body = 200, release
+            else:
+                tag_name = payload["tag_name"]
+                release = {
+                    **payload,
+                    "html_url": f"https://github.com/releases/{tag_name}",
+                    "id": len(server.releases) + 1,
+                }
+                server.releases[tag_name] = release
+                status, body = 201, release
+            if server.disconnects.get(self.command):  # the request took effect but its response is lost
+                server.disconnects[self.command] -= 1
+                self.close_connection = True
+                return
+            self._respond(status, body)
+
+    def _respond(self, status: int, body: Mapping[str, object] | str, headers: dict[str, str] | None = None) -> None:
+        data = (body if isinstance(body, str) else json.dumps(body)).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *_: object, **__: object) -> None:
+        pass
+
+
+class StubGitHubServer(ThreadingHTTPServer):
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubGitHubHandler)
+        self.clients: set[tuple[str, int]] = set()
+        self.disconnects: dict[str, int] = {}
+        self.failures: dict[str, list[tuple[int | None, dict[str, str]]]] = {}
+        self.lock = threading.Lock()
+        self.releases: dict[str, dict[str, object]] = {}
+        self.requests: list[tuple[str, str, object]] = []
+        self.token = secrets.token_hex()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api/v3"
+
+    def __enter__(self) -> Self:
+        threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.shutdown()
+        self.server_close()